@@ -34,6 +34,16 @@ class NoteCreationError(Exception):
         super().__init__(self.msg)
 
 
+class NoteReadError(Exception):
+    """Error while reading a note file."""
+
+    def __init__(self, path: Union[Path, str], exception: Exception):
+        self.path = path
+        self.exception = exception
+        self.msg = f'Error while reading the note at path: "{self.path}". Exception:\n{self.exception}'
+        super().__init__(self.msg)
+
+
 class UpdateContentError(Exception):
     """Error when updating the content of a note."""
 
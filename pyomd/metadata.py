@@ -3,31 +3,117 @@
 from __future__ import annotations
 
 import datetime
+import os
 import re
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from string import Template
-from typing import TYPE_CHECKING, Callable, Optional, Tuple, Type, Union
+from typing import TYPE_CHECKING, Callable, Iterable, Optional, Tuple, Type, Union
 
 import frontmatter  # type: ignore
+import yaml
+from frontmatter.default_handlers import BaseHandler  # type: ignore
 
 from pyomd.config import CONFIG
 
-from .exceptions import ArgTypeError, InvalidFrontmatterError
-from .misc import Order
+from .exceptions import (
+    ArgTypeError,
+    InvalidFrontmatterError,
+    ParsingNoteMetadataError,
+)
+from .misc import Order, read_notes
 
 if TYPE_CHECKING:
-    from note import Note
+    from .note import Note
+
+
+def _select_regex_engine(engine: str):
+    """Returns the module compiling the metadata patterns: re or google-re2.
+
+    google-re2 (linear-time matching on large or hostile notes) is an opt-in,
+    installed with the "re2" extra.
+
+    Args:
+        engine:
+            "re" or "re2"
+    """
+    if engine == "re":
+        return re
+    if engine == "re2":
+        import re2  # type: ignore  # pylint: disable=import-outside-toplevel
+
+        return re2
+    raise ValueError(
+        f'Unsupported value for PYOMD_REGEX_ENGINE: "{engine}" (expected "re" or "re2")'
+    )
+
+
+# regex engine of the metadata patterns, chosen with the environment variable
+# PYOMD_REGEX_ENGINE
+REGEX_ENGINE = os.environ.get("PYOMD_REGEX_ENGINE", "re")
+re_engine = _select_regex_engine(REGEX_ENGINE)
 
 UserInput = Union[str, int, float]
+_SCALAR_TYPES: tuple[type, ...] = (str, int, float)
 MetaValues = Union[list[str], None]
 MetaDict = dict[str, MetaValues]
 ParseFunction = Callable[[str], tuple[MetaDict, str]]
-Number = Union[int, float]
+# (raw frontmatter, content, python-frontmatter handler): see Frontmatter._split
+FrontmatterSplit = tuple[Optional[str], str, Optional[BaseHandler]]
 Span = tuple[int, int]
 SpanList = list[Span]
 
+# anchored at line starts; the prefix (list or quote markers, digits, ...) has
+# no letters nor underscores, so that "_k:: v" isn't read as field "k"
+_TMP_INLINE = Template(r"(?m)^(?P<beg>[^A-Za-z_\n]*)(?P<key>$key)::(?P<values>.*)")
+# anchored at line starts, on the first bracket, the first "::" after it and the
+# first closing bracket after that: each part matches in a single way, so that
+# lines without an enclosed field are rejected in linear time
+_TMP_INLINE_ENCLOSED = Template(
+    r"(?m)^(?P<beg>[^(\[\n]*)(?P<open>[(\[])(?P<key>$key)::(?P<values>[^)\]\n]*)(?P<close>[)\]])(?P<end>.*)"
+)
+_FRONTMATTER_RE = re_engine.compile(r"(?s)\A---\n(.*?)\n---\n")
+# "key: values" lines of a frontmatter (split on the first colon)
+_FM_FIELD_RE = re_engine.compile(r"(?m)^([^:\n]*):(.*)$")
+# YAML frontmatter delimiter, as defined by python-frontmatter
+_FM_BOUNDARY_RE = re.compile(r"^-{3,}\s*$", re.MULTILINE)
+# first characters of the YAML, TOML and JSON frontmatter formats
+_FM_OPENINGS = ("---", "+++", "{")
+# libyaml-based loader, when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_INLINE_RE = re_engine.compile(_TMP_INLINE.substitute(key="[A-Za-z][A-Za-z0-9_ -]*"))
+_INLINE_ENCLOSED_RE = re_engine.compile(
+    _TMP_INLINE_ENCLOSED.substitute(key=r"[^:\n]*(?::[^:\n]+)*")
+)
+# whole field lines, matched in a single multiline pass over the note. With re,
+# the lookahead rejects lines without "::" before the key is scanned. re2 has no
+# lookaheads but scans the whole note in linear time without it.
+if re_engine is re:
+    _INLINE_LINE_RE = re.compile(
+        _INLINE_RE.pattern.replace("^", r"^(?=[^\n]*::)", 1) + "\n?"
+    )
+else:
+    _INLINE_LINE_RE = re_engine.compile(_INLINE_RE.pattern + "\n?")
+# separator to add before/after inline metadata, by number of newlines at the
+# edge of the note content
+_SEP_BY_EDGE_NEWLINES = ("\n\n", "\n", "")
+_INLINE_ARTEFACTS_RE = [re.compile(re.escape("> [!info]- metadata") + "(\n\n|$)")]
+
+
+@lru_cache(maxsize=None)
+def _sep_table(seps: tuple[str, ...]) -> dict[int, str]:
+    """Translation table mapping single-char separators to a null char."""
+    return str.maketrans({sep: "\0" for sep in seps})
+
+
+@lru_cache(maxsize=1024)
+def _inline_key_re(key: str) -> re.Pattern:
+    """Compiled pattern matching the inline field lines of a given key."""
+    return re.compile(_TMP_INLINE.substitute(key=f"{re.escape(key)} *"))
+
 
 class MetadataType(Enum):
     """Type of metadata.
@@ -54,26 +140,26 @@ class MetadataType(Enum):
         """
         if s is None:
             return MetadataType.ALL
-        for k in MetadataType:
-            if s == k.value:
-                return k
-        raise ValueError(f'Metadatatype not defined: "{s}"')
+        try:
+            return _METADATA_TYPE_BY_VALUE[s]
+        except KeyError:
+            raise ValueError(f'Metadatatype not defined: "{s}"') from None
+
+
+_METADATA_TYPE_BY_VALUE: dict[str, MetadataType] = {m.value: m for m in MetadataType}
 
 
 class Metadata(ABC):
     """Common attributes and methods for all types of metadata."""
 
+    __slots__ = ("metadata",)
+
     def __init__(self, note_content: str):
         self.metadata: MetaDict = self._parse(note_content)
 
     def __repr__(self):
         rpr = f"{type(self)}:\n"
-        if self.to_string() is None:
-            rpr += " None"
-        else:
-            rpr += "".join(
-                [f'- {k}: {", ".join(v)}\n' for k, v in self.metadata.items()]
-            )
+        rpr += "".join(f'- {k}: {", ".join(v)}\n' for k, v in self.metadata.items())
         return rpr
 
     @abstractmethod
@@ -135,7 +221,9 @@ class Metadata(ABC):
         """
         if l is None:
             nl = list()
-        elif isinstance(l, UserInput):
+        elif type(l) is str:
+            nl = [l]
+        elif isinstance(l, _SCALAR_TYPES):
             nl = [str(l)]
         else:
             nl = [str(x) for x in l]
@@ -163,7 +251,12 @@ class Metadata(ABC):
         if l is None:
             del self.metadata[k]
             return
-        nl = [str(l)] if isinstance(l, UserInput) else [str(x) for x in l]
+        if type(l) is str:
+            nl = {l}
+        elif isinstance(l, _SCALAR_TYPES):
+            nl = {str(l)}
+        else:
+            nl = {str(x) for x in l}
         self.metadata[k] = [e for e in self.metadata[k] if e not in nl]
 
     def remove_empty(self) -> None:
@@ -185,8 +278,10 @@ class Metadata(ABC):
         See `NoteMetadata.remove_duplicate_values` for argument description
         """
 
+        list_keys: Iterable[str]
         if k is None:
-            list_keys = list(self.metadata.keys())
+            # values are reassigned to existing keys only: iterating the dict is safe
+            list_keys = self.metadata
         elif isinstance(k, str):
             list_keys = [k]
         elif isinstance(k, list):
@@ -199,9 +294,13 @@ class Metadata(ABC):
             )
 
         for k2 in list_keys:
-            if k2 not in self.metadata:
+            v = self.metadata.get(k2)
+            if v is None or len(v) < 2:
                 continue
-            self.metadata[k2] = list(dict.fromkeys(self.metadata[k2]))
+            dedup = dict.fromkeys(v)
+            # already unique values are left untouched
+            if len(dedup) != len(v):
+                self.metadata[k2] = list(dedup)
 
     def order_values(
         self, k: Union[str, list[str], None] = None, how: Order = Order.ASC
@@ -214,12 +313,14 @@ class Metadata(ABC):
             raise ArgTypeError(var_name="how", type_given=type(how), type_expected=Order)  # type: ignore
 
         if k is None:
-            k = list(self.metadata.keys())
-        if isinstance(k, str):
-            k = [k]
-        for e in k:
-            reverse = False if (how == Order.ASC) else True
-            self.metadata[e] = sorted(self.metadata[e], reverse=reverse)
+            values: Iterable[list[str]] = self.metadata.values()
+        else:
+            if isinstance(k, str):
+                k = [k]
+            values = [self.metadata[e] for e in k]
+        reverse = how == Order.DESC
+        for v in values:
+            v.sort(reverse=reverse)
 
     def order_keys(self, how: Order = Order.ASC) -> None:
         """Orders metadata keys.
@@ -229,8 +330,9 @@ class Metadata(ABC):
         See `NoteMetadata.order_keys` for argument description
         """
         reverse = how == Order.DESC
-        list_keys = sorted(list(self.metadata.keys()), reverse=reverse)
-        self.metadata = {k: self.metadata.pop(k) for k in list_keys}
+        self.metadata = {
+            k: self.metadata[k] for k in sorted(self.metadata, reverse=reverse)
+        }
 
     def order(
         self,
@@ -267,13 +369,22 @@ class Metadata(ABC):
     def _parse_special_fields(metadata: MetaDict, meta_type: MetadataType) -> MetaDict:
         """Parse special fields."""
         sep_field_name = f"{meta_type.value}_separators"
-        for k in metadata:
-            b1 = k in CONFIG.cfg["fields"]
-            b2 = sep_field_name in CONFIG.cfg["fields"].get(k, {})
-            if b1 and b2:
-                for sep in CONFIG.cfg["fields"][k][sep_field_name]:
-                    tmp = sep.join(metadata[k])
-                    metadata[k] = [t.strip() for t in tmp.split(sep) if t.strip() != ""]
+        # loop over the (few) configured fields rather than over the note's keys
+        for k, field_cfg in CONFIG.cfg["fields"].items():
+            if k not in metadata or sep_field_name not in field_cfg:
+                continue
+            values = metadata[k]
+            seps = tuple(field_cfg[sep_field_name])
+            if all(len(sep) == 1 for sep in seps):
+                # single-char separators: split on all of them in one pass
+                tokens = "\0".join(values).translate(_sep_table(seps)).split("\0")
+                values = [t for t in map(str.strip, tokens) if t]
+            else:
+                for sep in seps:
+                    values = [
+                        t for t in map(str.strip, sep.join(values).split(sep)) if t
+                    ]
+            metadata[k] = values
         return metadata
 
     @classmethod
@@ -299,7 +410,21 @@ class Frontmatter(Metadata):
             metadata dictionary
     """
 
-    REGEX = "(?s)(^---\n).*?(\n---\n)"
+    __slots__ = ()
+
+    REGEX = _FRONTMATTER_RE.pattern
+    PATTERN = _FRONTMATTER_RE
+
+    def __init__(self, note_content: str, split: Optional[FrontmatterSplit] = None):
+        """Parses the note's frontmatter.
+
+        Args:
+            note_content:
+                the note's textual content.
+            split:
+                output of Frontmatter._split(note_content), if already computed.
+        """
+        self.metadata: MetaDict = self._parse_1(note_content, split=split)
 
     def to_string(self) -> str:
         """Render metadata as a string.
@@ -309,14 +434,14 @@ class Frontmatter(Metadata):
         """
         if len(self.metadata) == 0:
             return ""
-        metadata_repr = ""
+        lines = ["---"]
         for k, v in self.metadata.items():
             if len(v) == 1:
-                metadata_repr += f"{k}: {v[0]}\n"
+                lines.append(f"{k}: {v[0]}")
             else:
-                metadata_repr += f'{k}: [ {", ".join(v)} ]\n'
-        out = "---\n" + metadata_repr + "---\n"
-        return out
+                lines.append(f'{k}: [ {", ".join(v)} ]')
+        lines.append("---\n")
+        return "\n".join(lines)
 
     def _update_content(self, note_content: str) -> str:
         """Returns the note content with the updated metadata.
@@ -348,31 +473,76 @@ class Frontmatter(Metadata):
             parse_fn = cls._parse_1
         return parse_fn(note_content)
 
+    @staticmethod
+    def _split(note_content: str) -> FrontmatterSplit:
+        """Splits the note into its raw frontmatter and its content.
+
+        YAML frontmatter is split directly on its "---" delimiters. Other
+        formats (TOML, JSON) are split by python-frontmatter handlers.
+
+        Returns:
+            (frontmatter, content, handler). frontmatter is None if the note has
+            none. handler is the python-frontmatter handler loading the
+            frontmatter, or None for YAML (loaded with PyYAML).
+        """
+        text = note_content.strip()
+        if not text.startswith(_FM_OPENINGS):
+            return None, text, None
+        if _FM_BOUNDARY_RE.match(text) is not None:
+            parts = _FM_BOUNDARY_RE.split(text, 2)
+            if len(parts) != 3:
+                return None, text, None
+            return parts[1], parts[2].strip(), None
+        handler = frontmatter.detect_format(text, frontmatter.handlers)
+        if handler is None:
+            return None, text, None
+        try:
+            fm, content = handler.split(text)
+        except ValueError:
+            return None, text, None
+        return fm, content.strip(), handler
+
     @classmethod
-    def _parse_1(cls, note_content: str) -> MetaDict:
+    def _load(cls, note_content: str, split: Optional[FrontmatterSplit] = None) -> dict:
+        """Loads the raw frontmatter dictionary (values are not normalized).
+
+        Args:
+            note_content:
+                the note's textual content.
+            split:
+                output of _split(note_content), if already computed.
+        """
+        fm, _, handler = cls._split(note_content) if split is None else split
+        if fm is None:
+            return {}
+        if handler is None:
+            data = yaml.load(fm, Loader=_YAML_LOADER)
+        else:
+            data = handler.load(fm)
+        return data if isinstance(data, dict) else {}
+
+    @classmethod
+    def _parse_1(
+        cls, note_content: str, split: Optional[FrontmatterSplit] = None
+    ) -> MetaDict:
         """Parse note content to extract metadata dictionary.
-        Uses the python-frontmatter library."""
+
+        YAML frontmatter is loaded with the PyYAML C loader (when available).
+        """
         try:
-            fm = frontmatter.loads(note_content)
+            meta_dict: MetaDict = cls._load(note_content, split=split)
         except Exception as e:
             raise InvalidFrontmatterError(exception=e) from e
 
-        meta_dict: MetaDict = fm.metadata
-
-        for k in meta_dict:
-            if meta_dict[k] is None:
-                meta_dict[k] = list()
-
-        # make all elements into list of strings
+        # make all elements into list of strings, in a single pass
         for k, v in meta_dict.items():
-            # print(f'K = "{k}"\nV = "{v}"\ntype(V) = "{type(v)}"')
-            if isinstance(v, str):
+            if v is None:
+                meta_dict[k] = []
+            elif isinstance(v, str):
                 meta_dict[k] = [v]
             elif isinstance(v, list):
                 meta_dict[k] = [str(x) for x in v]
-            elif isinstance(v, Number):
-                meta_dict[k] = [str(v)]
-            elif isinstance(v, datetime.date):
+            elif isinstance(v, (int, float, datetime.date)):
                 meta_dict[k] = [str(v)]
 
         meta_dict = cls._parse_special_fields(
@@ -383,34 +553,43 @@ class Frontmatter(Metadata):
     @classmethod
     def _parse_2(cls, note_content: str) -> MetaDict:
         """Parse frontmatter metadata using regex"""
-        mtc = re.search(cls.REGEX, note_content)
-        if mtc is None:
-            ext_str = list()
-        fm_str = mtc.group()
-        ext_str = [fm_str]
+        if not note_content.startswith("---\n"):
+            return {}
+        # same match as _FRONTMATTER_RE, without running the regex engine
+        end = note_content.find("\n---\n", 4)
+        if end == -1:
+            return {}
 
         # convert extracted string to dictionary
         metadata: MetaDict = {}
-        if len(ext_str) == 0:
-            return {}
-        ms = ext_str[0]
-        elements = ms.split("\n")
-        for e in elements:
-            if ":" not in e:
-                continue
-            k, v = e.split(":", maxsplit=1)
+        for k, v in _FM_FIELD_RE.findall(note_content, 4, end):
             c = [v.strip()] if "," not in v else [x.strip() for x in v.split(",")]
             metadata[k.strip()] = c
         if "tags" in metadata:
             mtags = " ".join(metadata["tags"])
-            metadata["tags"] = [t.strip() for t in mtags.split(" ") if t.strip() != ""]
+            metadata["tags"] = mtags.split()
 
         return metadata
 
+    @classmethod
+    def _exists(cls, note_content: str) -> bool:
+        """Checks if the note has a frontmatter.
+
+        Only loads the frontmatter: its values don't need to be normalized to
+        know if it is empty."""
+        try:
+            return len(cls._load(note_content)) > 0
+        except Exception as _:
+            return False
+
     @classmethod
     def _erase(cls, note_content: str) -> str:
-        r: str = frontmatter.loads(note_content).content
-        return r
+        """Removes the frontmatter from the note content.
+
+        The frontmatter is not loaded (it was already parsed when the object
+        was created).
+        """
+        return cls._split(note_content)[1]
 
 
 class InlineMetadata(Metadata):
@@ -421,12 +600,14 @@ class InlineMetadata(Metadata):
             metadata dictionary
     """
 
-    TMP_REGEX = Template(r"(?P<beg>.*?)(?P<key>$key)::(?P<values>.*)")
-    TMP_REGEX_ENCLOSED = Template(
-        r"(?P<beg>.*?)(?P<open>[(\[])(?P<key>$key)::(?P<values>.*?)(?P<close>[)\]])(?P<end>.*)"
-    )
-    REGEX = re.compile(TMP_REGEX.substitute(key="[A-z][A-z0-9_ -]*"))
-    REGEX_ENCLOSED = re.compile(TMP_REGEX_ENCLOSED.substitute(key=".*?"))
+    __slots__ = ()
+
+    TMP_REGEX = _TMP_INLINE
+    TMP_REGEX_ENCLOSED = _TMP_INLINE_ENCLOSED
+    REGEX = _INLINE_RE
+    REGEX_ENCLOSED = _INLINE_ENCLOSED_RE
+    REGEX_LINE = _INLINE_LINE_RE
+    REGEX_ARTEFACTS = _INLINE_ARTEFACTS_RE
 
     def to_string(
         self,
@@ -456,8 +637,7 @@ class InlineMetadata(Metadata):
         meta_dict = {k: v for (k, v) in self.metadata.items() if k not in ignore_k}
         if len(meta_dict) == 0:
             return ""
-        out = tml(meta_dict)
-        return out
+        return tml(meta_dict)
 
     def _update_content(
         self,
@@ -473,6 +653,12 @@ class InlineMetadata(Metadata):
         inplace:
             - replace inline metadata inplace (for existing fields in the note)
         """
+        if position not in ("top", "bottom"):
+            raise NotImplementedError
+        if len(self.metadata) == 0 and "::" not in note_content:
+            # no inline metadata to write, nor existing fields to update
+            nc = note_content if inplace else self._erase(note_content)
+            return nc.strip()
         if inplace:
             nc, ignore_k = self._update_content_inplace(note_content=note_content)
         else:
@@ -480,10 +666,8 @@ class InlineMetadata(Metadata):
         sep = self._get_sep_newlines(nc, position=position)
         if position == "top":
             new_nc = self.to_string(ignore_k=ignore_k, tml=tml) + sep + nc
-        elif position == "bottom":
-            new_nc = nc + sep + self.to_string(ignore_k=ignore_k, tml=tml)
         else:
-            raise NotImplementedError
+            new_nc = nc + sep + self.to_string(ignore_k=ignore_k, tml=tml)
         new_nc = new_nc.strip()
         return new_nc
 
@@ -503,66 +687,78 @@ class InlineMetadata(Metadata):
         Uses the python-frontmatter library.
         """
 
-        matches: list[re.Match] = list()
-        for l in note_content.split("\n"):
-            m = cls.REGEX.search(l)
-            b = m is not None
-            b_enc = cls.REGEX_ENCLOSED.search(l) is not None
-            if b and not b_enc:
-                matches.append(m)
+        if "::" not in note_content:
+            return {}
 
-        tmp: dict[str, list[str]] = dict()
-        for m in matches:
+        tmp: defaultdict[str, list[str]] = defaultdict(list)
+        for m in _INLINE_LINE_RE.finditer(note_content):
+            if _INLINE_ENCLOSED_RE.search(m.group()) is not None:
+                continue
             k = m.group("key").strip()
             v = m.group("values")
-            tmp[k] = tmp.get(k, "") + ", " + v
-        metadata: MetaDict = {
-            k: [x.strip() for x in v.split(",") if len(x.strip()) > 0]
-            for (k, v) in tmp.items()
-        }
+            tmp[k].extend(t for t in map(str.strip, v.split(",")) if t)
+        metadata: MetaDict = dict(tmp)
 
         metadata = cls._parse_special_fields(
             metadata=metadata, meta_type=MetadataType.INLINE
         )
         return metadata
 
+    @classmethod
+    def _exists(cls, note_content: str) -> bool:
+        """Checks if the note has inline metadata.
+
+        Stops at the first inline field, without parsing the others."""
+        if "::" not in note_content:
+            return False
+        for m in _INLINE_LINE_RE.finditer(note_content):
+            if _INLINE_ENCLOSED_RE.search(m.group()) is None:
+                return True
+        return False
+
     @classmethod
     def _erase(cls, note_content: str) -> str:
 
-        keep: list[str] = list()
-        for l in note_content.split("\n"):
-            b_match = re.search(cls.REGEX, l) is not None
-            b_match_enclosed = re.search(cls.REGEX_ENCLOSED, l) is not None
-            if b_match and not b_match_enclosed:
-                continue
-            keep.append(l)
-        content_no_meta = "\n".join(keep)
+        content_no_meta = note_content
+        if "::" in note_content:
+            erased_last_line = False
+
+            def erase_field(m: re.Match) -> str:
+                nonlocal erased_last_line
+                if _INLINE_ENCLOSED_RE.search(m.group()) is not None:
+                    return m.group()
+                if m.end() == len(note_content) and not m.group().endswith("\n"):
+                    erased_last_line = True
+                return ""
+
+            content_no_meta = _INLINE_LINE_RE.sub(erase_field, note_content)
+            # the newline preceding an erased last line goes away with it
+            if erased_last_line and content_no_meta.endswith("\n"):
+                content_no_meta = content_no_meta[:-1]
 
         ## artefacts to erase
-        artefacts = [re.escape("> [!info]- metadata") + "(\n\n|$)"]
-        for a in artefacts:
-            content_no_meta = re.sub(a, "", content_no_meta)
+        for a in _INLINE_ARTEFACTS_RE:
+            new_content, n = a.subn("", content_no_meta)
+            if n > 0:
+                content_no_meta = new_content
         return content_no_meta
 
     @staticmethod
     def _get_sep_newlines(content_no_meta: str, position: str = "bottom") -> str:
+        """Newlines separating the content from inline metadata added at position.
+
+        The separator only depends on the number of newlines (0, 1 or 2) at the
+        edge of the content where the metadata is added.
+        """
         if position == "top":
-            if len(content_no_meta) >= 1 and content_no_meta[0] != "\n":
-                sep = "\n\n"
-            elif len(content_no_meta) >= 1 and content_no_meta[0:2] != "\n\n":
-                sep = "\n"
-            else:
-                sep = ""
+            edge = content_no_meta[:2] or "\n\n"
+            n_newlines = len(edge) - len(edge.lstrip("\n"))
         elif position == "bottom":
-            if len(content_no_meta) >= 1 and content_no_meta[-1] != "\n":
-                sep = "\n\n"
-            elif len(content_no_meta) >= 2 and content_no_meta[-2:] != "\n\n":
-                sep = "\n"
-            else:
-                sep = ""
+            edge = content_no_meta[-2:].rjust(2, "\n")
+            n_newlines = len(edge) - len(edge.rstrip("\n"))
         else:
-            sep = ""
-        return sep
+            return ""
+        return _SEP_BY_EDGE_NEWLINES[n_newlines]
 
     @staticmethod
     def _get_spans_to_delete(
@@ -629,26 +825,25 @@ class InlineMetadata(Metadata):
             - list of updated fields.
         """
 
-        rgx = re.compile(self.REGEX.pattern + "\n?")
+        rgx = _INLINE_LINE_RE
 
         # remove fields that aren't in the metadata dictionary anymore
         spans: SpanList = self._get_spans_to_delete(
-            s=note_content, r=rgx, r_enc=self.REGEX_ENCLOSED, meta_dict=self.metadata
+            s=note_content, r=rgx, r_enc=_INLINE_ENCLOSED_RE, meta_dict=self.metadata
         )
         note_content = self._delete_spans(note_content, spans)
 
         # remove redundant inline metadata
         spans_redundant = self._get_span_redundant_keys(
-            s=note_content, r=rgx, r_enc=self.REGEX_ENCLOSED
+            s=note_content, r=rgx, r_enc=_INLINE_ENCLOSED_RE
         )
         note_content = self._delete_spans(note_content, spans_redundant)
 
         # update fields still in metadata dictionary
         updated_fields: set[str] = set()
         for key in self.metadata:
-            # print(f'this is key: "{key}"')
             new_v = ", ".join(self.metadata[key])
-            regex_field = re.compile(self.TMP_REGEX.substitute(key=f"{key} *"))
+            regex_field = _inline_key_re(key)
             for m in regex_field.finditer(note_content):
                 updated_fields.add(key)
                 beg = m.group("beg")
@@ -694,21 +889,96 @@ class NoteMetadata:
             inline metadata
     """
 
+    __slots__ = ("frontmatter", "inline", "_split_cache")
+
+    # metadata attributes on which an operation applies, for each metadata type
+    _DISPATCH: dict[MetadataType, tuple[str, ...]] = {
+        MetadataType.FRONTMATTER: ("frontmatter",),
+        MetadataType.INLINE: ("inline",),
+        MetadataType.ALL: ("frontmatter", "inline"),
+    }
+
     def __init__(self, note_content: str):
-        self.frontmatter = Frontmatter(note_content)
-        self.inline = InlineMetadata(note_content)
+        # the note is split once: the frontmatter is parsed from the split, and
+        # the inline metadata from the content without frontmatter
+        split = Frontmatter._split(note_content)
+        self.frontmatter = Frontmatter(note_content, split=split)
+        # (hash of the note content, note body without frontmatter): the body is
+        # reused once, by the first _update_content call on the same content
+        self._split_cache: Optional[tuple[int, str]] = (hash(note_content), split[1])
+        self.inline = InlineMetadata(split[1])
+
+    @classmethod
+    def from_path(cls, path: Union[Path, str]) -> NoteMetadata:
+        """Reads the note once and parses its frontmatter and inline metadata.
+
+        Args:
+            path:
+                path to the markdown note.
+
+        Raises:
+            NoteReadError: the note couldn't be read.
+            ParsingNoteMetadataError: the note's metadata couldn't be parsed.
+        """
+        return cls.from_paths([path])[0]
+
+    @classmethod
+    def from_paths(
+        cls, paths: Iterable[Union[Path, str]], workers: Optional[int] = None
+    ) -> list[NoteMetadata]:
+        """Parses the metadata of several notes.
+
+        Files are read concurrently in a thread pool (see `misc.read_notes`),
+        then parsed in the calling thread.
+
+        Args:
+            paths:
+                paths to the markdown notes.
+            workers:
+                number of reading threads. Defaults to min(32, number of paths).
+
+        Returns:
+            NoteMetadata objects, in the same order as paths.
+
+        Raises:
+            NoteReadError: a note couldn't be read.
+            ParsingNoteMetadataError: a note's metadata couldn't be parsed.
+        """
+        paths = list(paths)
+        contents = read_notes(paths, workers=workers)
+        metadatas: list[NoteMetadata] = []
+        for path, content in zip(paths, contents):
+            try:
+                metadatas.append(cls(content))
+            except Exception as e:
+                raise ParsingNoteMetadataError(path=path, exception=e) from e
+        return metadatas
 
     @classmethod
     def _parse_arg_meta_type(cls, meta_type: Union[MetadataType, None]) -> MetadataType:
+        if type(meta_type) is MetadataType:
+            return meta_type
         if meta_type is None:
-            meta_type = MetadataType.ALL
-        if not isinstance(meta_type, MetadataType):  # type: ignore
-            raise ArgTypeError(
-                var_name="meta_type",
-                type_given=type(meta_type),
-                type_expected=str(Union[MetadataType, None]),
-            )
-        return meta_type
+            return MetadataType.ALL
+        raise ArgTypeError(
+            var_name="meta_type",
+            type_given=type(meta_type),
+            type_expected=str(Union[MetadataType, None]),
+        )
+
+    def _dispatch(
+        self, meta_type: MetadataType, k: Union[str, list[str], None] = None
+    ) -> list[Metadata]:
+        """Returns the metadata objects an operation on meta_type applies to.
+
+        MetadataType.DEFAULT is resolved with get_default_metadata, for key k
+        when a single key is given."""
+        if meta_type == MetadataType.DEFAULT:
+            meta_type = self.get_default_metadata(k if isinstance(k, str) else None)
+        attrs = self._DISPATCH.get(meta_type)
+        if attrs is None:
+            raise ValueError(f"Unsupported value for argument meta_type: {meta_type}")
+        return [getattr(self, a) for a in attrs]
 
     def get_default_metadata(self, k: Optional[str]):
         """Get default metadata, as defined in the library configuration parameters.
@@ -842,13 +1112,9 @@ class NoteMetadata:
                 metadata type to modify.
                 If None, removes from both the frontmatter and inline metadata
         """
-        if meta_type == MetadataType.FRONTMATTER:
-            self.frontmatter.remove(k=k, l=l)
-        if meta_type == MetadataType.INLINE:
-            self.inline.remove(k=k, l=l)
-        if meta_type is None:
-            self.frontmatter.remove(k=k, l=l)
-            self.inline.remove(k=k, l=l)
+        meta_type = self._parse_arg_meta_type(meta_type)
+        for meta in self._dispatch(meta_type, k=k):
+            meta.remove(k=k, l=l)
 
     def remove_empty(
         self,
@@ -862,13 +1128,9 @@ class NoteMetadata:
                 All metadata fields with empty values are removed,
                 from the frontmatter and inline.
         """
-        if meta_type == MetadataType.FRONTMATTER:
-            self.frontmatter.remove_empty()
-        if meta_type == MetadataType.INLINE:
-            self.inline.remove_empty()
-        if meta_type is MetadataType.ALL:
-            self.frontmatter.remove_empty()
-            self.inline.remove_empty()
+        meta_type = self._parse_arg_meta_type(meta_type)
+        for meta in self._dispatch(meta_type):
+            meta.remove_empty()
 
     def remove_duplicate_values(
         self,
@@ -884,15 +1146,8 @@ class NoteMetadata:
                 metadata type. If None, performs the operation on all metadata types.
         """
         meta_type = self._parse_arg_meta_type(meta_type)
-        if meta_type == MetadataType.FRONTMATTER:
-            self.frontmatter.remove_duplicate_values(k=k)
-        elif meta_type == MetadataType.INLINE:
-            self.inline.remove_duplicate_values(k=k)
-        elif meta_type == MetadataType.ALL:
-            self.frontmatter.remove_duplicate_values(k=k)
-            self.inline.remove_duplicate_values(k=k)
-        else:
-            raise ValueError(f"Unsupported value for argument meta_type: {meta_type}")
+        for meta in self._dispatch(meta_type, k=k):
+            meta.remove_duplicate_values(k=k)
 
     def order_values(
         self,
@@ -911,15 +1166,8 @@ class NoteMetadata:
                 IF None, orders on all type of metadata (frontmatter and inline)
         """
         meta_type = self._parse_arg_meta_type(meta_type)
-        if meta_type == MetadataType.FRONTMATTER:
-            self.frontmatter.order_values(k=k, how=how)
-        elif meta_type == MetadataType.INLINE:
-            self.inline.order_values(k=k, how=how)
-        elif meta_type == MetadataType.ALL:
-            self.frontmatter.order_values(k=k, how=how)
-            self.inline.order_values(k=k, how=how)
-        else:
-            raise ValueError(f"Unsupported value for argument meta_type: {meta_type}")
+        for meta in self._dispatch(meta_type, k=k):
+            meta.order_values(k=k, how=how)
 
     def order_keys(
         self, how: Order = Order.DESC, meta_type: Union[MetadataType, None] = None
@@ -933,15 +1181,8 @@ class NoteMetadata:
                 If None, orders on all type of metadata (frontmatter and inline)
         """
         meta_type = self._parse_arg_meta_type(meta_type)
-        if meta_type == MetadataType.FRONTMATTER:
-            self.frontmatter.order_keys(how=how)
-        elif meta_type == MetadataType.INLINE:
-            self.inline.order_keys(how=how)
-        elif meta_type == MetadataType.ALL:
-            self.frontmatter.order_keys(how=how)
-            self.inline.order_keys(how=how)
-        else:
-            raise ValueError(f"Unsupported value for argument meta_type: {meta_type}")
+        for meta in self._dispatch(meta_type):
+            meta.order_keys(how=how)
 
     def order(
         self,
@@ -963,15 +1204,8 @@ class NoteMetadata:
                 If None, orders on all type of metadata (frontmatter and inline)
         """
         meta_type = self._parse_arg_meta_type(meta_type)
-        if meta_type == MetadataType.FRONTMATTER:
-            self.frontmatter.order(k=k, o_keys=o_keys, o_values=o_values)
-        elif meta_type == MetadataType.INLINE:
-            self.inline.order(k=k, o_keys=o_keys, o_values=o_values)
-        elif meta_type == MetadataType.ALL:
-            self.frontmatter.order(k=k, o_keys=o_keys, o_values=o_values)
-            self.inline.order(k=k, o_keys=o_keys, o_values=o_values)
-        else:
-            raise ValueError(f"Unsupported value for argument meta_type: {meta_type}")
+        for meta in self._dispatch(meta_type, k=k):
+            meta.order(k=k, o_keys=o_keys, o_values=o_values)
 
     def move(
         self,
@@ -1031,7 +1265,11 @@ class NoteMetadata:
         inline_tml: Union[str, Callable] = "standard",  # type: ignore
     ) -> str:
         """Update the note's metadata (frontmatter and inline)"""
-        str_no_fm = self.frontmatter._erase(note_content)
+        split_cache, self._split_cache = self._split_cache, None
+        if split_cache is not None and split_cache[0] == hash(note_content):
+            str_no_fm = split_cache[1]
+        else:
+            str_no_fm = self.frontmatter._erase(note_content)
         res = self.inline._update_content(
             str_no_fm, position=inline_position, inplace=inline_inplace, tml=inline_tml
         )
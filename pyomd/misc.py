@@ -1,4 +1,10 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+from .exceptions import NoteReadError
 
 
 class Order(Enum):
@@ -6,3 +12,70 @@ class Order(Enum):
 
     ASC = "asc"
     DESC = "desc"
+
+
+def read_note(path: Union[Path, str]) -> str:
+    """Reads a note file and decodes it once.
+
+    The file is read with os.read, until end of file. Its content is decoded
+    as strict UTF-8, whatever the locale, and newlines ("\\r\\n", "\\r") are
+    normalized to "\\n", as when reading in text mode.
+
+    Raises:
+        NoteReadError: the note isn't valid UTF-8.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        chunks: list[bytes] = []
+        while True:
+            chunk = os.read(fd, max(size, 1))
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    try:
+        content = b"".join(chunks).decode("utf-8")
+    except UnicodeDecodeError as e:
+        raise NoteReadError(path=path, exception=e) from e
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
+def _read_note_or_raise(path: Union[Path, str]) -> str:
+    try:
+        return read_note(path)
+    except NoteReadError:
+        raise
+    except Exception as e:
+        raise NoteReadError(path=path, exception=e) from e
+
+
+def read_notes(
+    paths: Iterable[Union[Path, str]], workers: Optional[int] = None
+) -> list[str]:
+    """Reads several notes, concurrently in a thread pool.
+
+    Args:
+        paths:
+            paths to the markdown notes.
+        workers:
+            number of reading threads. Defaults to min(32, number of paths).
+
+    Returns:
+        The notes' contents, in the same order as paths.
+
+    Raises:
+        NoteReadError: a note couldn't be read.
+    """
+    if workers is not None and workers < 1:
+        raise ValueError(f"workers must be a positive integer, got: {workers}")
+    paths = list(paths)
+    if len(paths) <= 1 or workers == 1:
+        return [_read_note_or_raise(p) for p in paths]
+    if workers is None:
+        workers = min(32, len(paths))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_read_note_or_raise, paths))
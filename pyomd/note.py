@@ -2,12 +2,21 @@
 
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Callable, Optional, Union
 
 from pyomd.metadata import MetadataType, NoteMetadata, NoteMetadataBatch
 
-from .exceptions import NoteCreationError, ParsingNoteMetadataError, UpdateContentError
+from .exceptions import (
+    NoteCreationError,
+    NoteReadError,
+    ParsingNoteMetadataError,
+    UpdateContentError,
+)
+from .misc import read_note, read_notes
+
+N_WORKERS_SCAN = min(8, os.cpu_count() or 1)
 
 
 class Note:
@@ -29,16 +38,8 @@ class Note:
             path: path to the markdown note.
         """
         self.path: Path = Path(path)
-        try:
-            with open(self.path, "r") as f:
-                self.content: str = f.read()
-        except Exception as e:
-            raise NoteCreationError(path=path, exception=e) from e
-
-        try:
-            self.metadata: NoteMetadata = NoteMetadata(self.content)
-        except Exception as e:
-            raise ParsingNoteMetadataError(path=path, exception=e) from e
+        self.content: str = self._read_content(self.path)
+        self.metadata: NoteMetadata = self._parse_metadata(self.path, self.content)
 
     def __repr__(self) -> str:
         return f'Note (path: "{self.path}")\n'
@@ -50,11 +51,7 @@ class Note:
             str_append: string to append to the note content.
             allow_repeat: Add the string if it is already present in the note content.
         """
-        if allow_repeat:
-            self.content += f"\n{str_append}"
-        else:
-            if len(re.findall(re.escape(str_append), self.content)) == 0:
-                self.content += f"\n{str_append}"
+        self.content = self._append_str(self.content, str_append, allow_repeat)
 
     def print(self):
         """Prints the note content to the screen."""
@@ -130,15 +127,44 @@ class Note:
                 path to the note. If None, overwrites the current note content.
         """
         p = self.path if path is None else path
-        with open(p, "w") as f:
+        with open(p, "w", encoding="utf-8") as f:
             f.write(self.content)
 
+    @classmethod
+    def _from_content(cls, path: Path, content: str) -> "Note":
+        """Creates a Note from its already read content."""
+        note = cls.__new__(cls)
+        note.path = Path(path)
+        note.content = content
+        note.metadata = cls._parse_metadata(note.path, content)
+        return note
+
     @staticmethod
     def _is_md_file(path: Path):
         exist = path.exists()
         is_md = path.suffix == ".md"
         return exist and is_md
 
+    @staticmethod
+    def _read_content(path: Path) -> str:
+        try:
+            return read_note(path)
+        except Exception as e:
+            raise NoteCreationError(path=path, exception=e) from e
+
+    @staticmethod
+    def _parse_metadata(path: Path, content: str) -> NoteMetadata:
+        try:
+            return NoteMetadata(content)
+        except Exception as e:
+            raise ParsingNoteMetadataError(path=path, exception=e) from e
+
+    @staticmethod
+    def _append_str(content: str, str_append: str, allow_repeat: bool) -> str:
+        if allow_repeat or str_append not in content:
+            content += f"\n{str_append}"
+        return content
+
 
 class Notes:
     """A batch of notes.
@@ -164,11 +190,18 @@ class Notes:
         """
         self.notes: list[Note] = []
         self.add(paths=paths, recursive=recursive)
-        self.metadata = NoteMetadataBatch(self.notes)
 
     def __len__(self):
         return len(self.notes)
 
+    def __getitem__(self, i: int) -> Note:
+        return self.notes[i]
+
+    @property
+    def metadata(self) -> NoteMetadataBatch:
+        """NoteMetadataBatch object on the current notes."""
+        return NoteMetadataBatch(self.notes)
+
     def add(self, paths: Union[Path, list[Path]], recursive: bool = True):
         """Adds new notes to the Notes object.
 
@@ -181,18 +214,83 @@ class Notes:
         """
         if isinstance(paths, Path):
             paths = [paths]
+        md_paths: list[Path] = []
         for pth in paths:
             assert pth.exists(), f"file or folder doesn't exist: '{pth}'"
             if pth.is_dir():
-                for root, _, fls in os.walk(pth):  # type: ignore
-                    for f_name in fls:  # type: ignore
-                        pth_f: Path = Path(root) / f_name  # type: ignore
-                        if Note._is_md_file(pth_f):
-                            self.notes.append(Note(path=pth_f))
-                    if not recursive:
-                        break
+                md_paths += self._scan_md_files(pth, recursive=recursive)
             elif Note._is_md_file(pth):
-                self.notes.append(Note(path=pth))
+                md_paths.append(pth)
+        self._add_notes(md_paths)
+
+    def _add_notes(self, paths: list[Path]):
+        """Reads the notes in a thread pool, then parses their metadata.
+
+        File reads release the GIL and overlap; parsing (pure python) is done
+        in the calling thread, in the order of paths."""
+        try:
+            contents = read_notes(paths)
+        except NoteReadError as e:
+            raise NoteCreationError(path=e.path, exception=e.exception) from e
+        for path, content in zip(paths, contents):
+            self.notes.append(Note._from_content(path, content))
+
+    def _keep(self, mask: list[bool]):
+        """Keeps only the notes for which mask is True."""
+        self.notes = [n for (n, k) in zip(self.notes, mask) if k]
+
+    @staticmethod
+    def _scan_md_files(
+        root: Path, recursive: bool = True, n_workers: int = N_WORKERS_SCAN
+    ) -> list[Path]:
+        """Lists the markdown files contained in a directory.
+
+        The directories of each depth are scanned in a thread pool. The files
+        are returned in the order of a top-down os.walk.
+
+        Args:
+            root:
+                path to the directory to scan
+            recursive:
+                whether to scan sub-directories too
+            n_workers:
+                number of scanning threads
+        """
+        # markdown files and sub-directories of each scanned directory
+        listing: dict[Path, tuple[list[Path], list[Path]]] = {}
+        level = [root]
+        with ThreadPoolExecutor(max_workers=max(1, n_workers)) as executor:
+            while len(level) > 0:
+                scans = executor.map(Notes._scan_dir, level, [recursive] * len(level))
+                listing.update(zip(level, scans))
+                level = [d for pth_d in level for d in listing[pth_d][1]]
+
+        md_files: list[Path] = []
+        stack = [root]
+        while len(stack) > 0:
+            files, subdirs = listing[stack.pop()]
+            md_files += files
+            stack.extend(reversed(subdirs))
+        return md_files
+
+    @staticmethod
+    def _scan_dir(pth_d: Path, recursive: bool) -> tuple[list[Path], list[Path]]:
+        """Lists the markdown files and the sub-directories of a directory.
+
+        Unreadable directories are skipped, as os.walk does."""
+        files: list[Path] = []
+        subdirs: list[Path] = []
+        try:
+            with os.scandir(pth_d) as entries:
+                for e in entries:
+                    if e.is_dir():
+                        if recursive and not e.is_symlink():
+                            subdirs.append(Path(e.path))
+                    elif os.path.splitext(e.name)[1] == ".md" and e.is_file():
+                        files.append(Path(e.path))
+        except OSError:
+            return [], []
+        return files, subdirs
 
     def append(self, str_append: str, allow_repeat: bool = False):
         """Appends text to the note content.
@@ -225,23 +323,23 @@ class Notes:
                 (key_name, l_values, meta_type)
                 that correspond to the arguments of NoteMetadata.has()
         """
+        names = [n.path.name for n in self.notes]
+        mask = [True] * len(names)
         if starts_with is not None:
-            self.notes = [
-                n for n in self.notes if str(n.path.name).startswith(starts_with)
-            ]
+            mask = [m and n.startswith(starts_with) for (m, n) in zip(mask, names)]
         if ends_with is not None:
-            self.notes = [n for n in self.notes if str(n.path.name).endswith(ends_with)]
+            mask = [m and n.endswith(ends_with) for (m, n) in zip(mask, names)]
         if pattern is not None:
-            self.notes = [n for n in self.notes if re.match(pattern, str(n.path.name))]
+            rgx = re.compile(pattern)
+            mask = [m and rgx.match(n) is not None for (m, n) in zip(mask, names)]
         if has_meta is not None:
-            include: list[bool] = []
-            for note in self.notes:
-                inc = True
+            for i, note in enumerate(self.notes):
+                if not mask[i]:
+                    continue
                 for (k, vals, meta_type) in has_meta:
                     if not note.metadata.has(k=k, l=vals, meta_type=meta_type):
-                        inc = False
-                include.append(inc)
-            self.notes = [n for (n, inc) in zip(self.notes, include) if inc]
+                        mask[i] = False
+        self._keep(mask)
 
     def update_content(
         self,
@@ -1,11 +1,9 @@
-import inspect
-from functools import partial
 from pathlib import Path
 from typing import Callable, Type, Union
 
 import pytest
 
-from pyomd.exceptions import InvalidFrontmatterError  # pylance: ignore
+from pyomd.exceptions import InvalidFrontmatterError
 from pyomd.metadata import (
     InlineMetadata,
     MetadataType,
@@ -30,42 +28,48 @@ PATH_TEST_NOTES = PATH_TEST_DATA / "notes"
 
 ###
 
+# exceptions that can be expected by the tests, by name
+_EXC_MAP: dict[str, Type[Exception]] = {
+    "InvalidFrontmatterError": InvalidFrontmatterError,
+}
+
 TestTemplateMetadata = Callable[[str, dict, bool], None]
 
 
-def add_test_function_metadata(
-    glob: dict,
-    fn: TestTemplateMetadata,
-    test_id: str,
+def params_test_metadata(
+    fns: list[TestTemplateMetadata],
     data: dict,
     meta_type: Union[MetadataType, None] = None,
-):
-    """Adds a test function to the global environment.
+) -> list:
+    """Builds the pytest parameters of the tests related to the Metadata object.
 
-    Tests related to the Metadata object.
+    One parameter (fn, test_id) is built for each test ID of each template.
 
     Args:
-        glob:
-            dictionary of global variables (returned by globals())
-        fn:
-            test template function.
-            Takes as arguments:
+        fns:
+            test templates functions.
+            Take as arguments:
                 test_id: the test ID
-                data: dictionary of data returned by
+                data: dictionary of data returned by load_data
                 debug: activate debug mode
-        test_id: the test ID
         data: dict containing note and test data
-        meta_type: metadata type
+        meta_type: metadata type (read from the test data if None)
     """
-    ft = partial(fn, test_id=test_id, data=data)
+    params = []
+    for fn in fns:
+        name_f = parse_name_function_tested(fn.__name__)
+        for test_id in data["tests"][f"tests-{name_f}"]:
+            mt = meta_type
+            if mt is None:
+                mt = get_test_arg_meta_type(test_id=test_id, name_f=name_f, data=data)
+            params.append(
+                pytest.param(fn, test_id, id=f"{mt.value}_{name_f}_{test_id}")
+            )
+    return params
+
+
+def prep_test_data(test_id: str, data: dict, fn: TestTemplateMetadata):
     name_f = parse_name_function_tested(fn.__name__)
-    if meta_type is None:
-        meta_type = get_test_arg_meta_type(test_id=test_id, name_f=name_f, data=data)
-    ft_name = f"test_{meta_type.value}_{name_f}_{test_id}"
-    glob[ft_name] = ft
-
-
-def prep_test_data(test_id: str, data: dict, name_f: str):
     d_t: dict = data["tests"][f"tests-{name_f}"][test_id]
     inputs: dict = d_t["inputs"]
 
@@ -85,11 +89,10 @@ def prep_test_data(test_id: str, data: dict, name_f: str):
 
 def t_parse(test_id: str, data: dict, debug: bool = False) -> None:
 
-    name_f = parse_name_function_tested(inspect.currentframe().f_code.co_name)
-    _, expected_output, d_n, d_t, MetaClass = prep_test_data(test_id, data, name_f)
+    _, expected_output, d_n, d_t, MetaClass = prep_test_data(test_id, data, t_parse)
 
     if "exception" in expected_output:
-        exception: Type[Exception] = globals()[expected_output["exception"]]
+        exception: Type[Exception] = _EXC_MAP[expected_output["exception"]]
         with pytest.raises(exception):
             MetaClass._parse(d_n["content"])
     else:
@@ -104,8 +107,9 @@ def t_parse(test_id: str, data: dict, debug: bool = False) -> None:
 
 def t__extract_str(test_id: str, data: dict, debug: bool = False) -> None:
 
-    name_f = parse_name_function_tested(inspect.currentframe().f_code.co_name)
-    _, expected_output, d_n, _, MetaClass = prep_test_data(test_id, data, name_f)
+    _, expected_output, d_n, _, MetaClass = prep_test_data(
+        test_id, data, t__extract_str
+    )
 
     str_exr: list[str] = MetaClass._extract_str(d_n["content"])  # type: ignore
     str_exr_true: list[str] = expected_output["str_extracted"]
@@ -117,8 +121,9 @@ def t__extract_str(test_id: str, data: dict, debug: bool = False) -> None:
 
 def t__str_to_dict(test_id: str, data: dict, debug: bool = False) -> None:
 
-    name_f = parse_name_function_tested(inspect.currentframe().f_code.co_name)
-    inputs, expected_output, _, d_t, MetaClass = prep_test_data(test_id, data, name_f)
+    inputs, expected_output, _, d_t, MetaClass = prep_test_data(
+        test_id, data, t__str_to_dict
+    )
 
     meta_dict: dict = MetaClass._str_to_dict(inputs["str_extracted"])  # type: ignore
     meta_dict_true: dict = expected_output["meta_dict"]
@@ -131,8 +136,7 @@ def t__str_to_dict(test_id: str, data: dict, debug: bool = False) -> None:
 
 def t_to_string(test_id: str, data: dict, debug: bool = False) -> None:
 
-    name_f = parse_name_function_tested(inspect.currentframe().f_code.co_name)
-    _, expected_output, d_n, d_t, MetaClass = prep_test_data(test_id, data, name_f)
+    _, expected_output, d_n, d_t, MetaClass = prep_test_data(test_id, data, t_to_string)
 
     m = MetaClass(d_n["content"])
     tostr: str = m.to_string()  # type: ignore
@@ -148,8 +152,9 @@ def t_to_string(test_id: str, data: dict, debug: bool = False) -> None:
 
 def t_update_content(test_id: str, data: dict, debug: bool = False) -> None:
 
-    name_f = parse_name_function_tested(inspect.currentframe().f_code.co_name)
-    inputs, expected_output, d_n, d_t, MetaClass = prep_test_data(test_id, data, name_f)
+    inputs, expected_output, d_n, d_t, MetaClass = prep_test_data(
+        test_id, data, t_update_content
+    )
 
     m = MetaClass(d_n["content"])
     if isinstance(m, InlineMetadata):
@@ -171,8 +176,7 @@ def t_update_content(test_id: str, data: dict, debug: bool = False) -> None:
 
 def t_exists(test_id: str, data: dict, debug: bool = False) -> None:
 
-    name_f = parse_name_function_tested(inspect.currentframe().f_code.co_name)
-    _, expected_output, d_n, d_t, MetaClass = prep_test_data(test_id, data, name_f)
+    _, expected_output, d_n, d_t, MetaClass = prep_test_data(test_id, data, t_exists)
 
     exists: bool = MetaClass._exists(d_n["content"])  # type: ignore
     exists_true: str = expected_output["exists"]
@@ -186,8 +190,7 @@ def t_exists(test_id: str, data: dict, debug: bool = False) -> None:
 
 def t_add(test_id: str, data: dict, debug: bool = False) -> None:
 
-    name_f = parse_name_function_tested(inspect.currentframe().f_code.co_name)
-    inputs, expected_output, d_n, d_t, MetaClass = prep_test_data(test_id, data, name_f)
+    inputs, expected_output, d_n, d_t, MetaClass = prep_test_data(test_id, data, t_add)
 
     m = MetaClass(d_n["content"])
     m.add(k=inputs["k"], l=inputs["l"], overwrite=inputs["overwrite"])  # type: ignore
@@ -203,8 +206,9 @@ def t_add(test_id: str, data: dict, debug: bool = False) -> None:
 
 def t_remove(test_id: str, data: dict, debug: bool = False) -> None:
 
-    name_f = parse_name_function_tested(inspect.currentframe().f_code.co_name)
-    inputs, expected_output, d_n, d_t, MetaClass = prep_test_data(test_id, data, name_f)
+    inputs, expected_output, d_n, d_t, MetaClass = prep_test_data(
+        test_id, data, t_remove
+    )
 
     m = MetaClass(d_n["content"])
     m.remove(k=inputs["k"], l=inputs["l"])  # type: ignore
@@ -220,8 +224,9 @@ def t_remove(test_id: str, data: dict, debug: bool = False) -> None:
 
 def t_remove_and_update(test_id: str, data: dict, debug: bool = False) -> None:
 
-    name_f = parse_name_function_tested(inspect.currentframe().f_code.co_name)
-    inputs, expected_output, d_n, d_t, MetaClass = prep_test_data(test_id, data, name_f)
+    inputs, expected_output, d_n, d_t, MetaClass = prep_test_data(
+        test_id, data, t_remove_and_update
+    )
 
     m = MetaClass(d_n["content"])
     arg_k = inputs["k"]
@@ -242,8 +247,9 @@ def t_remove_and_update(test_id: str, data: dict, debug: bool = False) -> None:
 
 def t_remove_duplicate_values(test_id: str, data: dict, debug: bool = False) -> None:
 
-    name_f = parse_name_function_tested(inspect.currentframe().f_code.co_name)
-    inputs, expected_output, d_n, d_t, MetaClass = prep_test_data(test_id, data, name_f)
+    inputs, expected_output, d_n, d_t, MetaClass = prep_test_data(
+        test_id, data, t_remove_duplicate_values
+    )
 
     m = MetaClass(d_n["content"])
     m.remove_duplicate_values(k=inputs["k"])
@@ -259,8 +265,9 @@ def t_remove_duplicate_values(test_id: str, data: dict, debug: bool = False) ->
 
 def t_order_values(test_id: str, data: dict, debug: bool = False) -> None:
 
-    name_f = parse_name_function_tested(inspect.currentframe().f_code.co_name)
-    inputs, expected_output, d_n, d_t, MetaClass = prep_test_data(test_id, data, name_f)
+    inputs, expected_output, d_n, d_t, MetaClass = prep_test_data(
+        test_id, data, t_order_values
+    )
     how = parse_test_arg_order(inputs["how"])
 
     m = MetaClass(d_n["content"])
@@ -277,8 +284,9 @@ def t_order_values(test_id: str, data: dict, debug: bool = False) -> None:
 
 def t_order_keys(test_id: str, data: dict, debug: bool = False) -> None:
 
-    name_f = parse_name_function_tested(inspect.currentframe().f_code.co_name)
-    inputs, expected_output, d_n, d_t, MetaClass = prep_test_data(test_id, data, name_f)
+    inputs, expected_output, d_n, d_t, MetaClass = prep_test_data(
+        test_id, data, t_order_keys
+    )
     how = parse_test_arg_order(inputs["how"])
 
     m = MetaClass(d_n["content"])
@@ -295,8 +303,9 @@ def t_order_keys(test_id: str, data: dict, debug: bool = False) -> None:
 
 def t_order(test_id: str, data: dict, debug: bool = False) -> None:
 
-    name_f = parse_name_function_tested(inspect.currentframe().f_code.co_name)
-    inputs, expected_output, d_n, d_t, MetaClass = prep_test_data(test_id, data, name_f)
+    inputs, expected_output, d_n, d_t, MetaClass = prep_test_data(
+        test_id, data, t_order
+    )
     o_keys = parse_test_arg_order(inputs["o_keys"])
     o_values = parse_test_arg_order(inputs["o_values"])
 
@@ -318,8 +327,7 @@ def t_order(test_id: str, data: dict, debug: bool = False) -> None:
 
 def t_erase(test_id: str, data: dict, debug: bool = False) -> None:
 
-    name_f = parse_name_function_tested(inspect.currentframe().f_code.co_name)
-    _, expected_output, d_n, d_t, MetaClass = prep_test_data(test_id, data, name_f)
+    _, expected_output, d_n, d_t, MetaClass = prep_test_data(test_id, data, t_erase)
 
     ers: str = MetaClass._erase(d_n["content"])  # type: ignore
     name_field_true: str = expected_output["field_name"]
@@ -336,8 +344,9 @@ def t_erase(test_id: str, data: dict, debug: bool = False) -> None:
 
 def nmt_remove_duplicate_values(test_id: str, data: dict, debug: bool = False) -> None:
 
-    name_f = parse_name_function_tested(inspect.currentframe().f_code.co_name)
-    inputs, expected_output, d_n, d_t, _ = prep_test_data(test_id, data, name_f)
+    inputs, expected_output, d_n, d_t, _ = prep_test_data(
+        test_id, data, nmt_remove_duplicate_values
+    )
 
     m = NoteMetadata(d_n["content"])
     meta_type = parse_test_arg_meta_type(inputs["meta_type"])
@@ -357,8 +366,7 @@ def nmt_remove_duplicate_values(test_id: str, data: dict, debug: bool = False) -
 
 def nmt_has(test_id: str, data: dict, debug: bool = False) -> None:
 
-    name_f = parse_name_function_tested(inspect.currentframe().f_code.co_name)
-    inputs, expected_output, d_n, d_t, _ = prep_test_data(test_id, data, name_f)
+    inputs, expected_output, d_n, d_t, _ = prep_test_data(test_id, data, nmt_has)
 
     m = NoteMetadata(d_n["content"])
     meta_type = parse_test_arg_meta_type(inputs["meta_type"])
@@ -370,8 +378,7 @@ def nmt_has(test_id: str, data: dict, debug: bool = False) -> None:
 
 def nmt_get(test_id: str, data: dict, debug: bool = False) -> None:
 
-    name_f = parse_name_function_tested(inspect.currentframe().f_code.co_name)
-    inputs, expected_output, d_n, d_t, _ = prep_test_data(test_id, data, name_f)
+    inputs, expected_output, d_n, d_t, _ = prep_test_data(test_id, data, nmt_get)
 
     m = NoteMetadata(d_n["content"])
 
@@ -386,8 +393,9 @@ def nmt_get(test_id: str, data: dict, debug: bool = False) -> None:
 
 def nmt_order_values(test_id: str, data: dict, debug: bool = False) -> None:
 
-    name_f = parse_name_function_tested(inspect.currentframe().f_code.co_name)
-    inputs, expected_output, d_n, d_t, _ = prep_test_data(test_id, data, name_f)
+    inputs, expected_output, d_n, d_t, _ = prep_test_data(
+        test_id, data, nmt_order_values
+    )
 
     m = NoteMetadata(d_n["content"])
     meta_type = parse_test_arg_meta_type(inputs["meta_type"])
@@ -408,8 +416,7 @@ def nmt_order_values(test_id: str, data: dict, debug: bool = False) -> None:
 
 def nmt_order_keys(test_id: str, data: dict, debug: bool = False) -> None:
 
-    name_f = parse_name_function_tested(inspect.currentframe().f_code.co_name)
-    inputs, expected_output, d_n, d_t, _ = prep_test_data(test_id, data, name_f)
+    inputs, expected_output, d_n, d_t, _ = prep_test_data(test_id, data, nmt_order_keys)
 
     m = NoteMetadata(d_n["content"])
     meta_type = parse_test_arg_meta_type(inputs["meta_type"])
@@ -430,8 +437,7 @@ def nmt_order_keys(test_id: str, data: dict, debug: bool = False) -> None:
 
 def nmt_order(test_id: str, data: dict, debug: bool = False) -> None:
 
-    name_f = parse_name_function_tested(inspect.currentframe().f_code.co_name)
-    inputs, expected_output, d_n, d_t, _ = prep_test_data(test_id, data, name_f)
+    inputs, expected_output, d_n, d_t, _ = prep_test_data(test_id, data, nmt_order)
 
     m = NoteMetadata(d_n["content"])
     k = inputs["k"]
@@ -459,8 +465,7 @@ def nmt_order(test_id: str, data: dict, debug: bool = False) -> None:
 
 def nmt_move(test_id: str, data: dict, debug: bool = False) -> None:
 
-    name_f = parse_name_function_tested(inspect.currentframe().f_code.co_name)
-    inputs, expected_output, d_n, d_t, _ = prep_test_data(test_id, data, name_f)
+    inputs, expected_output, d_n, d_t, _ = prep_test_data(test_id, data, nmt_move)
 
     m = NoteMetadata(d_n["content"])
     fr = parse_test_arg_meta_type(inputs["fr"])
@@ -481,8 +486,9 @@ def nmt_move(test_id: str, data: dict, debug: bool = False) -> None:
 
 def nmt_update_content(test_id: str, data: dict, debug: bool = False) -> None:
 
-    name_f = parse_name_function_tested(inspect.currentframe().f_code.co_name)
-    inputs, expected_output, d_n, d_t, _ = prep_test_data(test_id, data, name_f)
+    inputs, expected_output, d_n, d_t, _ = prep_test_data(
+        test_id, data, nmt_update_content
+    )
 
     arg_content: str = d_n["content"]
     arg_inline_pos: str = inputs["inline_position"]
@@ -490,12 +496,11 @@ def nmt_update_content(test_id: str, data: dict, debug: bool = False) -> None:
     nb_times = int(inputs.get("nb_times", 1))
 
     m = NoteMetadata(arg_content)
-    for _ in range(nb_times):
-        upd: str = m._update_content(
-            note_content=arg_content,
-            inline_position=arg_inline_pos,
-            inline_inplace=arg_inline_inplace,
-        )  # type: ignore
+    upd: str = m._update_content(
+        note_content=arg_content,
+        inline_position=arg_inline_pos,
+        inline_inplace=arg_inline_inplace,
+    )  # type: ignore
     name_field_true: str = expected_output["field_name"]
     upd_true: str = d_n[name_field_true]
 
@@ -504,3 +509,13 @@ def nmt_update_content(test_id: str, data: dict, debug: bool = False) -> None:
 
     err_msg = build_error_msg(test_id, d_t)
     assert_str_match(upd, upd_true, msg=err_msg)
+
+    # updating an already updated content doesn't change it
+    for _ in range(nb_times - 1):
+        upd_next: str = m._update_content(
+            note_content=upd,
+            inline_position=arg_inline_pos,
+            inline_inplace=arg_inline_inplace,
+        )  # type: ignore
+        assert_str_match(upd_next, upd, msg=err_msg)
+        upd = upd_next
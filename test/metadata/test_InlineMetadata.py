@@ -1,9 +1,12 @@
 from pathlib import Path
 
+import pytest
+
+from pyomd.metadata import InlineMetadata
+
 from ..test_utils import load_data
 from .templates import (
-    add_test_function_metadata,
-    parse_name_function_tested,
+    params_test_metadata,
     t_erase,
     t_exists,
     t_parse,
@@ -12,23 +15,39 @@ from .templates import (
     t_update_content,
 )
 
+PATH_TEST_DEF = Path(__file__).parent / "test_InlineMetadata.json"
+DATA = load_data(PATH_TEST_DEF)
+
+
+@pytest.mark.parametrize(
+    "t_fn,test_id",
+    params_test_metadata(
+        [
+            t_parse,
+            t_to_string,
+            t_update_content,
+            t_exists,
+            t_erase,
+            t_remove_and_update,
+        ],
+        DATA,
+    ),
+)
+def test_inline_metadata(t_fn, test_id):
+    t_fn(test_id=test_id, data=DATA)
 
-def main():
-    PATH_TEST_DEF = Path(__file__).parent / "test_InlineMetadata.json"
-    data = load_data(PATH_TEST_DEF)
 
-    for t_fn in [
-        t_parse,
-        t_to_string,
-        t_update_content,
-        t_exists,
-        t_erase,
-        t_remove_and_update,
-    ]:
-        name_f = parse_name_function_tested(t_fn.__name__)
-        test_ids: list[str] = list(data["tests"][f"tests-{name_f}"].keys())
-        for tid in test_ids:
-            add_test_function_metadata(glob=globals(), fn=t_fn, test_id=tid, data=data)
+def test_underscore_prefix_not_a_field():
+    content = "_u:: q\n- k:: v"
+    meta = InlineMetadata(content)
+    assert meta.metadata == {"k": ["v"]}
+    meta.metadata["k"] = ["w"]
+    assert meta._update_content(content) == "_u:: q\n- k :: w"
 
 
-main()
+@pytest.mark.parametrize("key", ["a(b", "c++"])
+def test_update_content_special_key(key):
+    content = "body\nk:: v"
+    meta = InlineMetadata(content)
+    meta.add(k=key, l="x")
+    assert meta._update_content(content) == f"body\nk :: v\n\n{key}:: x"
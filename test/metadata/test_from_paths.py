@@ -0,0 +1,65 @@
+"""Reading notes from disk: misc.read_note(s) and NoteMetadata.from_path(s)."""
+
+from pathlib import Path
+
+import pytest
+
+from pyomd.exceptions import NoteReadError
+from pyomd.metadata import NoteMetadata
+from pyomd.misc import read_note, read_notes
+
+PATH_TEST_NOTES = Path(__file__).parent / "../0-test-data/notes"
+PATHS = [PATH_TEST_NOTES / f"n{i}" / f"n{i}.md" for i in [1, 2, 4, 5, 7]]
+
+
+def test_read_note_newlines(tmp_path: Path):
+    path = tmp_path / "note.md"
+    path.write_bytes("l1\r\nl2\rl3\né\n".encode("utf-8"))
+    assert read_note(path) == "l1\nl2\nl3\né\n"
+
+
+def test_read_note_invalid_utf8(tmp_path: Path):
+    path = tmp_path / "note.md"
+    path.write_bytes("é".encode("latin-1"))
+    with pytest.raises(NoteReadError) as exc_info:
+        read_note(path)
+    assert exc_info.value.path == path
+    assert isinstance(exc_info.value.exception, UnicodeDecodeError)
+
+
+@pytest.mark.parametrize("workers", [None, 1, 3])
+def test_read_notes(workers):
+    contents = read_notes(PATHS, workers=workers)
+    assert contents == [p.read_text(encoding="utf-8") for p in PATHS]
+
+
+def test_read_notes_missing_path(tmp_path: Path):
+    missing = tmp_path / "missing.md"
+    with pytest.raises(NoteReadError) as exc_info:
+        read_notes([PATHS[0], missing])
+    assert exc_info.value.path == missing
+
+
+def test_read_notes_invalid_workers():
+    with pytest.raises(ValueError, match="workers"):
+        read_notes(PATHS, workers=0)
+
+
+def test_from_paths():
+    metadatas = NoteMetadata.from_paths(PATHS, workers=2)
+    for path, meta in zip(PATHS, metadatas):
+        meta_true = NoteMetadata(path.read_text(encoding="utf-8"))
+        assert meta.frontmatter.metadata == meta_true.frontmatter.metadata
+        assert meta.inline.metadata == meta_true.inline.metadata
+
+
+def test_from_path():
+    meta = NoteMetadata.from_path(PATHS[2])
+    meta_true = NoteMetadata(PATHS[2].read_text(encoding="utf-8"))
+    assert meta.frontmatter.metadata == meta_true.frontmatter.metadata
+    assert meta.inline.metadata == meta_true.inline.metadata
+
+
+def test_from_path_missing(tmp_path: Path):
+    with pytest.raises(NoteReadError):
+        NoteMetadata.from_path(tmp_path / "missing.md")
@@ -0,0 +1,48 @@
+"""Metadata edited in place, through the metadata dictionary or get()."""
+
+from pyomd.metadata import MetadataType, NoteMetadata
+
+CONTENT = "---\nauthor: x\ntags: [a, b]\n---\nbody\n"
+
+
+def test_frontmatter_edit_in_place():
+    m = NoteMetadata(CONTENT)
+    m._update_content(CONTENT)
+    m.frontmatter.metadata["author"] = ["y"]
+    m.frontmatter.get("tags").append("c")  # type: ignore
+
+    assert m.frontmatter.to_string() == "---\nauthor: y\ntags: [ a, b, c ]\n---\n"
+    assert m._update_content(CONTENT).startswith(
+        "---\nauthor: y\ntags: [ a, b, c ]\n---\n"
+    )
+
+
+def test_inline_edit_in_place():
+    content = "body\n\nauthor:: x\ntags:: a, b"
+    m = NoteMetadata(content)
+    m._update_content(content, inline_inplace=False)
+    m.inline.metadata["author"] = ["y"]
+    m.inline.get("tags").append("c")  # type: ignore
+
+    assert m.inline.to_string() == "author:: y\ntags:: a, b, c"
+    assert m._update_content(content, inline_inplace=False) == (
+        "body\n\nauthor:: y\ntags:: a, b, c"
+    )
+
+
+def test_remove_default_meta_type():
+    m = NoteMetadata(CONTENT + "\nauthor:: z\nstatus:: draft")
+    m.remove(k="tags", meta_type=MetadataType.DEFAULT)
+    m.remove(k="author", meta_type=MetadataType.DEFAULT)
+
+    assert m.frontmatter.metadata == {"author": ["x"]}
+    assert m.inline.metadata == {"status": ["draft"]}
+
+
+def test_update_content_after_edit():
+    content = CONTENT + "\nstatus:: draft"
+    m = NoteMetadata(content)
+    upd = m._update_content(content + "\n\nappended")
+    assert upd.endswith("status :: draft\n\nappended")
+    assert m._split_cache is None
+    assert m._update_content(upd) == upd
@@ -0,0 +1,62 @@
+"""The metadata patterns give the same results with the re and re2 engines.
+
+The engine is chosen at import time (PYOMD_REGEX_ENGINE), so each engine runs
+in its own python process.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PATH_REPO = Path(__file__).parents[2]
+PATH_TEST_NOTES = PATH_REPO / "test/0-test-data/notes"
+
+SCRIPT = """
+import json, sys
+from pathlib import Path
+from pyomd import metadata
+from pyomd.metadata import Frontmatter, InlineMetadata
+
+out = {"engine": metadata.re_engine.__name__, "notes": {}}
+for path in sorted(Path(sys.argv[1]).glob("*/*.md")):
+    c = path.read_text()
+    out["notes"][path.name] = [
+        Frontmatter._parse_2(c),
+        Frontmatter._erase(c),
+        InlineMetadata._parse(c),
+        InlineMetadata._erase(c),
+        InlineMetadata._exists(c),
+        InlineMetadata(c)._update_content(c, inplace=True),
+    ]
+print(json.dumps(out))
+"""
+
+
+def run_with_engine(engine: str) -> subprocess.CompletedProcess:
+    env = dict(os.environ, PYOMD_REGEX_ENGINE=engine)
+    return subprocess.run(
+        [sys.executable, "-c", SCRIPT, str(PATH_TEST_NOTES)],
+        cwd=PATH_REPO,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+
+
+def test_re2_same_results():
+    pytest.importorskip("re2")
+    out_re = json.loads(run_with_engine("re").stdout)
+    out_re2 = json.loads(run_with_engine("re2").stdout)
+    assert out_re["engine"] == "re"
+    assert out_re2["engine"] == "re2"
+    assert out_re2["notes"] == out_re["notes"]
+
+
+def test_invalid_engine():
+    res = run_with_engine("pcre")
+    assert res.returncode != 0
+    assert "PYOMD_REGEX_ENGINE" in res.stderr
@@ -1,8 +1,8 @@
-import inspect
-from functools import partial
 from pathlib import Path
 from typing import Callable, Union
 
+import pytest
+
 from pyomd.metadata import MetadataType
 from pyomd.note import Notes
 
@@ -20,15 +20,18 @@ PATH_TEST_NOTES = PATH_TEST_DATA / "notes"
 TestTemplateNote = Callable[[str, dict, bool], None]
 
 
-def add_test_function_note(glob: dict, fn: TestTemplateNote, test_id: str, data: dict):
-
-    ft = partial(fn, test_id=test_id, data=data)
-    name_f = parse_name_function_tested(fn.__name__)
-    ft_name = f"test_{name_f}_{test_id}"
-    glob[ft_name] = ft
+def params_test_note(fns: list[TestTemplateNote], data: dict) -> list:
+    """Builds the pytest parameters (fn, test_id) of the tests related to Notes."""
+    params = []
+    for fn in fns:
+        name_f = parse_name_function_tested(fn.__name__)
+        for test_id in data["tests"][f"tests-{name_f}"]:
+            params.append(pytest.param(fn, test_id, id=f"{name_f}_{test_id}"))
+    return params
 
 
-def prep_test_data_note(test_id: str, data: dict, name_f: str):
+def prep_test_data_note(test_id: str, data: dict, fn: TestTemplateNote):
+    name_f = parse_name_function_tested(fn.__name__)
     d_t: dict = data["tests"][f"tests-{name_f}"][test_id]
 
     inputs: dict = d_t["inputs"]
@@ -50,8 +53,7 @@ def parse_test_arg_has_meta(
 
 def t___init__(test_id: str, data: dict, debug: bool = False):
 
-    name_f = parse_name_function_tested(inspect.currentframe().f_code.co_name)
-    inputs, expected_output, d_t = prep_test_data_note(test_id, data, name_f)
+    inputs, expected_output, d_t = prep_test_data_note(test_id, data, t___init__)
 
     input_paths = [PATH_TEST_NOTES / x for x in inputs["paths"]]
     nts = Notes(paths=input_paths, recursive=inputs["recursive"])
@@ -64,8 +66,7 @@ def t___init__(test_id: str, data: dict, debug: bool = False):
 
 def t_filter(test_id: str, data: dict, debug: bool = False):
 
-    name_f = parse_name_function_tested(inspect.currentframe().f_code.co_name)
-    inputs, expected_output, d_t = prep_test_data_note(test_id, data, name_f)
+    inputs, expected_output, d_t = prep_test_data_note(test_id, data, t_filter)
 
     arg_input_paths = [PATH_TEST_NOTES / x for x in inputs["paths"]]
     arg_recursive = inputs["recursive"]
@@ -0,0 +1,107 @@
+"""Notes objects: scanning, indexing, filtering and writing the notes of a batch."""
+
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+import pyomd.misc
+from pyomd.exceptions import NoteCreationError
+from pyomd.note import Note, Notes
+
+PATH_TEST_NOTES = Path(__file__).parent / "../0-test-data/notes"
+
+
+def copy_notes(tmp_path: Path, names: list[str]) -> Path:
+    for name in names:
+        shutil.copytree(PATH_TEST_NOTES / name, tmp_path / name)
+    return tmp_path
+
+
+def test_indexing():
+    nts = Notes(paths=[PATH_TEST_NOTES / "n7"])
+    assert len(nts) == 2
+    assert isinstance(nts[0], Note)
+    assert nts[0] is nts.notes[0]
+    assert nts[-1] is nts.notes[1]
+
+
+def test_note_kept_across_filter():
+    nts = Notes(paths=[PATH_TEST_NOTES / "n7", PATH_TEST_NOTES / "n4"])
+    before = {n.path.name: n for n in nts.notes}
+    nt = before["n7_copy.md"]
+    nts.filter(starts_with="n4")
+
+    assert nt.path.name == "n7_copy.md"
+    assert all(n.path.name.startswith("n4") for n in nts.notes)
+    assert all(n is before[n.path.name] for n in nts.notes)
+
+
+def test_notes_assignable():
+    nts = Notes(paths=[PATH_TEST_NOTES / "n7"])
+    nts.notes = [n for n in nts.notes if n.path.name == "n7.md"]
+    assert len(nts) == 1
+    nts.metadata.add(k="new_key", l="v")
+    assert nts[0].metadata.has(k="new_key", l="v")
+
+
+def test_append_and_write(tmp_path: Path):
+    root = copy_notes(tmp_path, ["n7"])
+    nts = Notes(paths=[root / "n7"])
+    nts.append("appended text")
+    nts.write()
+    for nt in nts.notes:
+        assert nt.content.endswith("\nappended text")
+        assert (root / "n7" / nt.path.name).read_text() == nt.content
+
+
+def make_tree(root: Path) -> Path:
+    for d in ["a", "a/b", "a/b/c", "d", "e/f"]:
+        (root / d).mkdir(parents=True)
+    for f in ["x.md", "a/y.md", "a/b/z.md", "a/b/c/w.md", "d/v.md", "e/f/u.md"]:
+        (root / f).write_text(f)
+    (root / "a/not_md.txt").write_text("")
+    return root
+
+
+def walk_md_files(root: Path, recursive: bool) -> list[Path]:
+    md_files = []
+    for r, _, fls in os.walk(root):
+        md_files += [Path(r) / f for f in fls if f.endswith(".md")]
+        if not recursive:
+            break
+    return md_files
+
+
+@pytest.mark.parametrize("n_workers", [1, 4])
+@pytest.mark.parametrize("recursive", [True, False])
+def test_scan_order(tmp_path: Path, recursive: bool, n_workers: int):
+    root = make_tree(tmp_path)
+    expected = walk_md_files(root, recursive)
+    assert Notes._scan_md_files(root, recursive, n_workers=n_workers) == expected
+    assert [n.path for n in Notes(paths=root, recursive=recursive).notes] == expected
+
+
+def test_scan_error_raised(tmp_path: Path, monkeypatch):
+    root = make_tree(tmp_path)
+    scandir = os.scandir
+
+    def failing_scandir(path):
+        if Path(path).name == "b":
+            raise RuntimeError("scan failed")
+        return scandir(path)
+
+    monkeypatch.setattr(os, "scandir", failing_scandir)
+    with pytest.raises(RuntimeError):
+        Notes._scan_md_files(root, n_workers=4)
+
+
+def test_read_error(monkeypatch):
+    def failing_read_note(path):
+        raise OSError("read failed")
+
+    monkeypatch.setattr(pyomd.misc, "read_note", failing_read_note)
+    with pytest.raises(NoteCreationError) as exc_info:
+        Notes(paths=[PATH_TEST_NOTES / "n7"])
+    assert isinstance(exc_info.value.exception, OSError)
@@ -1,6 +1,8 @@
 import difflib
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from string import Template
 from typing import Union
@@ -11,32 +13,43 @@ PATH_TEST_NOTES = PATH_TEST_DATA / "notes"
 from pyomd.metadata import MetadataType, Order
 
 
+def _read_file(path: Union[Path, str]) -> str:
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
 def load_test_notes(path_test_notes: Union[Path, None]) -> dict:
     """ """
     data = dict()
     if path_test_notes is None:
         return data
-    note_dirs = os.listdir(path_test_notes)
+    with os.scandir(path_test_notes) as entries:
+        note_dirs = [e.name for e in entries if e.is_dir()]
+    # (note dir, field name, path) of all files to read
+    to_read: list[tuple[str, str, Union[Path, str]]] = []
     for nd in note_dirs:
         path_nd = path_test_notes / nd
-        data[nd] = {"path": path_nd / f"{nd}.md"}
-        with open(data[nd]["path"], "r") as f:
-            data[nd]["content"] = f.read()
-        md_files = [
-            x
-            for x in os.listdir(path_nd)
-            if x.endswith(".md") and x != data[nd]["path"].name
-        ]
-        for mdf in md_files:
-            path_mdf = path_nd / mdf
-            field_name = Path(mdf).stem.split("-", maxsplit=1)[-1]
-            with open(path_mdf, "r") as f:
-                data[nd][field_name] = f.read()
+        main_name = f"{nd}.md"
+        data[nd] = {"path": path_nd / main_name}
+        to_read.append((nd, "content", data[nd]["path"]))
+        with os.scandir(path_nd) as entries:
+            for e in entries:
+                if e.name.endswith(".md") and e.name != main_name:
+                    # "<note>-<field>.md" -> "<field>"
+                    prefix, sep, field_name = e.name[:-3].partition("-")
+                    if not sep:
+                        field_name = prefix
+                    to_read.append((nd, field_name, e.path))
+
+    with ThreadPoolExecutor() as executor:
+        contents = executor.map(_read_file, [p for (_, _, p) in to_read])
+        for (nd, field_name, _), content in zip(to_read, contents):
+            data[nd][field_name] = content
     return data
 
 
 def load_test_definitions(path_test_def: Path) -> dict:
-    with open(path_test_def, "r") as f:
+    with open(path_test_def, "r", encoding="utf-8") as f:
         test_def = json.load(f)
     return test_def
 
@@ -64,6 +77,7 @@ def get_test_arg_meta_type(
     return parse_test_arg_meta_type(meta_type_str)
 
 
+@lru_cache(maxsize=None)
 def parse_test_arg_meta_type(
     meta_type_str: Union[str, None]
 ) -> Union[MetadataType, str, None]:
@@ -78,6 +92,7 @@ def parse_test_arg_meta_type(
     return meta_type
 
 
+@lru_cache(maxsize=None)
 def parse_test_arg_order(order_str: str) -> Union[Order, str]:
     if order_str == ">>Order.ASC":
         order = Order.ASC